@@ -6,11 +6,11 @@ import json
 from gtts import gTTS
 from io import BytesIO
 import base64
-import os
 from difflib import get_close_matches
 from collections import defaultdict
 import time  # For tracking time spent
 from ai_models import analyze_learning_style, analyze_strengths_weaknesses, generate_personalized_path  # Import the updated function
+from content_store import ContentStore, collect_content, open_store, pack_content, source_mtimes  # Memory-mapped read-only content shared across workers
 
 # Optional Rain Animation
 try:
@@ -53,6 +53,25 @@ with st.sidebar:
     kinesthetic_preference = st.slider("Prefer hands-on learning?", 1, 5, 3)
     update_learning_style("kinesthetic", kinesthetic_preference)
 
+# 📦 Read-only content (questions, quizzes, concepts), mapped once per process.
+# The cache is keyed on the sources' modification times, so edits to the JSON files
+# are picked up on the next rerun without restarting the server. A failed build is
+# cached the same way, so it is retried only after the sources change.
+@st.cache_resource(max_entries=1)
+def load_content(sources_mtime):
+    try:
+        return open_store(), []
+    except (OSError, ValueError) as error:
+        problems = [f"Could not build the shared content store ({error}). Loading content directly."]
+        errors = []
+        store = ContentStore(buffer=pack_content(collect_content(errors=errors)))
+        problems += [f"Skipped {path}: {reason}" for path, reason in errors]
+        return store, problems
+
+content, content_problems = load_content(source_mtimes())
+for problem in content_problems:
+    st.error(f"⚠️ {problem}")
+
 # Initialize session state for user data and interaction tracking
 if "user_data" not in st.session_state:
     st.session_state.user_data = {}
@@ -119,14 +138,10 @@ def speak_text(text):
 
 # ✅ Ask a Question with Fuzzy Match
 def ask_question(query, subject):
-    file_path = "questions.json"
-    if not os.path.exists(file_path):
+    if "questions" not in content:
         return "📂 Questions file not found. Please upload the questions.json file."
 
-    with open(file_path, "r") as file:
-        data = json.load(file)
-
-    subject_questions = data.get(subject, [])
+    subject_questions = content["questions"].get(subject, [])
     questions_list = [item["question"] for item in subject_questions]
 
     match = get_close_matches(query.lower(), [q.lower() for q in questions_list], n=1, cutoff=0.4)
@@ -138,83 +153,12 @@ def ask_question(query, subject):
                 return item["answer"]
     return "🤔 I couldn't find an exact answer, but try rephrasing or asking about a specific topic!"
 
-# Define a basic concept hierarchy (can be expanded)
-concept_hierarchy = {
-    "Physics": {
-        "foundational": ["Kinematics", "Laws of Motion", "Work and Energy"],
-        "intermediate": ["Gravitation", "Optics"],
-        "advanced": ["Electromagnetism", "Quantum Mechanics"],
-    },
-    "Biology": {
-        "foundational": ["Cell Structure", "Basic Biochemistry"],
-        "intermediate": ["Genetics", "Photosynthesis", "Respiration"],
-        "advanced": ["Evolution", "Ecology"],
-    },
-    "Mathematics": {
-        "foundational": ["Basic Algebra", "Basic Geometry"],
-        "intermediate": ["Linear Equations", "Trigonometry", "Calculus Basics"],
-        "advanced": ["Differential Equations", "Linear Algebra"],
-    },
-    "Chemistry": {
-        "foundational": ["Atomic Structure", "Periodic Table", "Chemical Bonding"],
-        "intermediate": ["Chemical Reactions", "Stoichiometry", "Acids and Bases"],
-        "advanced": ["Organic Chemistry", "Thermodynamics"],
-    },
-}
-
-# Example mapping of concepts to resources (Extend this!)
-concept_resources = {
-    "Kinematics": {
-        "visual": ["Kinematics Diagrams", "Motion Graphs"],
-        "auditory": ["Kinematics Audio Lecture"],
-        "interactive": ["Kinematics Simulation"],
-    },
-    "Laws of Motion": {
-        "visual": ["Newton's Laws Diagrams"],
-        "auditory": ["Newton's Laws Explanation"],
-        "interactive": ["Force and Motion Lab"],
-    },
-    "Cell Structure": {
-        "visual": ["Cell Diagrams", "Microscope Images"],
-        "auditory": ["Cell Biology Lecture"],
-        "interactive": ["Virtual Cell Tour"],
-    },
-    "Genetics": {
-        "visual": ["Punnett Squares", "DNA Structure"],
-        "auditory": ["Genetics Explanation"],
-        "interactive": ["DNA Replication Game"],
-    },
-    "Basic Algebra":{
-        "visual":["Algebraic Equations","Graphing"],
-        "auditory":["Algebra Basics"],
-        "interactive":["Algebra practice"]
-    },
-    "Basic Geometry":{
-        "visual":["Geometric Shapes", "Theorems"],
-        "auditory":["Geometry Basics"],
-        "interactive":["Geometry Tool"]
-    },
-    "Atomic Structure":{
-        "visual":["Atomic Models","Electron Configuration"],
-        "auditory":["Atomic Structure explanation"],
-        "interactive":["Build an Atom"]
-    },
-    "Periodic Table":{
-        "visual":["Periodic Table","Element Trends"],
-        "auditory":["Periodic Table explanation"],
-        "interactive":["Periodic Table Game"]
-    }
-
-    # Add resources for other concepts
-}
+# Concept hierarchy and concept-to-resource mapping (edit concepts.json to extend)
+concept_hierarchy = content["concept_hierarchy"]
+concept_resources = content["concept_resources"]
 
 def generate_quiz(subject):
-    quiz_file = f"quiz_{subject.lower()}.json"
-    if os.path.exists(quiz_file):
-        with open(quiz_file, "r") as file:
-            quiz_data = json.load(file)
-        return quiz_data.get("questions", [])
-    return []
+    return list(content["quizzes"].get(subject.lower(), []))
 
 def get_learning_path(subject):
     topics = {
@@ -312,7 +256,7 @@ with tab3:
         if not st.session_state.submitted:
             for i, q in enumerate(questions):
                 st.markdown(f"**Q{i+1}. {q['question']}**")
-                st.session_state.user_answers[i] = st.radio(f"Choose your answer:", q["options"], key=f"q{i}")
+                st.session_state.user_answers[i] = st.radio(f"Choose your answer:", list(q["options"]), key=f"q{i}")
             if st.button("Submit Quiz"):
                 st.session_state.submitted = True
                 correct_answers = {}
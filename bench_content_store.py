@@ -0,0 +1,127 @@
+# bench_content_store.py
+# Measures per-worker memory for the read-only content: N forked workers each load
+# the content either the old way (json.load of every file) or by opening the shared
+# mmap store, then report RSS / PSS / private memory from /proc/self/smaps_rollup
+# while all of them are alive. The "none" row (workers load nothing) is the noise
+# floor to subtract. Linux only.
+#
+#   python bench_content_store.py --workers 8 --scale 200
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+from content_store import CONCEPTS_FILE, QUESTIONS_FILE, QUIZ_SUBJECTS, MappedDict, MappedList, collect_content, open_store
+
+
+def _memory():
+    fields = {}
+    with open("/proc/self/smaps_rollup") as file:
+        for line in file:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "private": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def _suffixed(value, suffix):
+    if isinstance(value, dict):
+        return {k: _suffixed(v, suffix) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_suffixed(v, suffix) for v in value]
+    if isinstance(value, str):
+        return f"{value} #{suffix}"
+    return value
+
+
+def build_scaled_sources(base_dir, scale):
+    """
+    Copies the shipped sources, repeating every question and quiz item `scale` times
+    with unique strings (so interning cannot collapse the copies).
+    """
+    with open(QUESTIONS_FILE) as file:
+        questions = json.load(file)
+    scaled = {subject: [_suffixed(item, k) for k in range(scale) for item in items] for subject, items in questions.items()}
+    with open(os.path.join(base_dir, QUESTIONS_FILE), "w") as file:
+        json.dump(scaled, file)
+
+    for subject in QUIZ_SUBJECTS:
+        quiz_file = f"quiz_{subject}.json"
+        with open(quiz_file) as file:
+            items = json.load(file).get("questions", [])
+        with open(os.path.join(base_dir, quiz_file), "w") as file:
+            json.dump({"questions": [_suffixed(item, k) for k in range(scale) for item in items]}, file)
+
+    shutil.copy(CONCEPTS_FILE, base_dir)
+
+
+def _touch(value):
+    if isinstance(value, (dict, MappedDict)):
+        for item in value.values():
+            _touch(item)
+    elif isinstance(value, (list, MappedList)):
+        for item in value:
+            _touch(item)
+
+
+def _worker(mode, base_dir, store_path, loaded, measured, results):
+    before = _memory()
+    if mode == "none":
+        content = None  # noise floor: fork copy-on-write and interpreter bookkeeping
+    elif mode == "json":
+        content = collect_content(base_dir)
+    else:
+        content = open_store(store_path, base_dir)
+    _touch(content)  # every page of the content is read at least once
+    gc.collect()
+    loaded.wait()
+    after = _memory()
+    results.put({k: after[k] - before[k] for k in after})
+    measured.wait()
+
+
+def measure(mode, workers, base_dir, store_path):
+    context = multiprocessing.get_context("fork")
+    loaded, measured = context.Barrier(workers), context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=_worker, args=(mode, base_dir, store_path, loaded, measured, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    deltas = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return {k: sum(d[k] for d in deltas) / workers for k in deltas[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--scale", type=int, default=200, help="repeat each question/quiz item this many times")
+    args = parser.parse_args()
+
+    base_dir = tempfile.mkdtemp(prefix="edugenie-bench-")
+    try:
+        build_scaled_sources(base_dir, args.scale)
+        store_path = os.path.join(base_dir, "content.bin")
+        open_store(store_path, base_dir).close()
+        print(f"scale={args.scale} workers={args.workers} store={os.path.getsize(store_path) // 1024} KB")
+        print("mode   rss_kB  pss_kB  private_kB   (mean increase per worker)")
+        for mode in ("none", "json", "mmap"):
+            result = measure(mode, args.workers, base_dir, store_path)
+            print(f"{mode:<6}{result['rss']:>8.0f}{result['pss']:>8.0f}{result['private']:>12.0f}")
+    finally:
+        shutil.rmtree(base_dir)
+
+
+if __name__ == "__main__":
+    main()
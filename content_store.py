@@ -0,0 +1,411 @@
+# content_store.py
+# Packs the read-only content (questions, quizzes, concept graph, resources) into a
+# single binary file that every Streamlit worker opens with mmap, so the pages are
+# shared through the OS page cache instead of being parsed into each process.
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from collections.abc import Mapping, Sequence
+
+STORE_PATH = "content.bin"
+QUESTIONS_FILE = "questions.json"
+CONCEPTS_FILE = "concepts.json"
+QUIZ_SUBJECTS = ["physics", "biology", "mathematics", "chemistry"]
+
+# File layout (little-endian):
+#   header: magic (8 bytes), version (u32), root node offset (u32), offset (u32) of
+#           a LIST node holding the source_mtimes() fingerprint the store was built from
+#   nodes:  tag (u8), count (u32), then
+#           STR  -> `count` bytes of UTF-8
+#           LIST -> `count` u32 child offsets
+#           DICT -> `count` (key offset u32, value offset u32) pairs in insertion
+#                   order, followed by `count` u32 entry indices sorted by key bytes
+#           INT  -> `count` bytes of ASCII decimal (JSON ints are unbounded)
+#           FLOAT-> an f64 payload (`count` is unused)
+#           BOOL -> no payload, `count` holds 0 or 1
+#           NULL -> no payload
+MAGIC = b"EDUGENIE"
+VERSION = 3
+_HEADER = struct.Struct("<8sIII")
+_NODE = struct.Struct("<BI")
+_U32 = struct.Struct("<I")
+_PAIR = struct.Struct("<II")
+_F64 = struct.Struct("<d")
+_STR, _LIST, _DICT, _INT, _FLOAT, _BOOL, _NULL = 1, 2, 3, 4, 5, 6, 7
+
+
+def _quiz_file(subject):
+    return f"quiz_{subject}.json"
+
+
+def _source_files(base_dir):
+    files = [QUESTIONS_FILE, CONCEPTS_FILE] + [_quiz_file(s) for s in QUIZ_SUBJECTS]
+    return [os.path.join(base_dir, f) for f in files]
+
+
+def _load_json(path, errors=None, shape=dict):
+    """
+    Loads a JSON source whose top level must be a `shape` (dict by default).
+    Returns None for a missing file; other failures raise, or are appended to
+    `errors` as (path, error) if it is a list.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r") as file:
+            data = json.load(file)
+        if not isinstance(data, shape):
+            raise ValueError(f"expected a JSON {shape.__name__}, got {type(data).__name__}")
+        return data
+    except (OSError, ValueError) as error:
+        if errors is None:
+            raise
+        errors.append((path, error))
+        return None
+
+
+def _checked(path, value, shape, errors):
+    if isinstance(value, shape):
+        return value
+    error = ValueError(f"expected a JSON {shape.__name__}, got {type(value).__name__}")
+    if errors is None:
+        raise error
+    errors.append((path, error))
+    return None
+
+
+def source_mtimes(base_dir="."):
+    """
+    Returns the modification times of the JSON sources (None for a missing file).
+    """
+    return tuple(os.path.getmtime(f) if os.path.exists(f) else None for f in _source_files(base_dir))
+
+
+def collect_content(base_dir=".", errors=None):
+    """
+    Reads every read-only JSON source into one nested dict (the store's root).
+    If `errors` is a list, unreadable, malformed or wrongly shaped files are skipped
+    and recorded there as (path, error) pairs instead of raising ValueError/OSError.
+    """
+    content = {}
+    questions = _load_json(os.path.join(base_dir, QUESTIONS_FILE), errors)
+    if questions is not None:
+        content["questions"] = questions
+
+    quizzes = {}
+    for subject in QUIZ_SUBJECTS:
+        quiz_path = os.path.join(base_dir, _quiz_file(subject))
+        quiz_data = _load_json(quiz_path, errors)
+        if quiz_data is not None:
+            questions = _checked(quiz_path, quiz_data.get("questions", []), list, errors)
+            if questions is not None:
+                quizzes[subject] = questions
+    content["quizzes"] = quizzes
+
+    concepts_path = os.path.join(base_dir, CONCEPTS_FILE)
+    concepts = _load_json(concepts_path, errors) or {}
+    for key in ("concept_hierarchy", "concept_resources"):
+        content[key] = _checked(concepts_path, concepts.get(key, {}), dict, errors) or {}
+    return content
+
+
+class _Writer:
+    def __init__(self):
+        self.buf = bytearray(_HEADER.size)
+        self.strings = {}  # interned: repeated strings are stored once
+
+    def write(self, value):
+        if isinstance(value, str):
+            return self._write_str(value)
+        if value is None:
+            return self._node(_NULL, 0)
+        if isinstance(value, bool):  # before int: bool is an int subclass
+            return self._node(_BOOL, int(value))
+        if isinstance(value, int):
+            data = str(value).encode("ascii")
+            offset = self._node(_INT, len(data))
+            self.buf += data
+            return offset
+        if isinstance(value, float):
+            offset = self._node(_FLOAT, 0)
+            self.buf += _F64.pack(value)
+            return offset
+        if isinstance(value, list):
+            children = [self.write(v) for v in value]
+            offset = self._node(_LIST, len(children))
+            for child in children:
+                self.buf += _U32.pack(child)
+            return offset
+        if isinstance(value, dict):
+            pairs = [(self._write_str(k), self.write(v)) for k, v in value.items()]
+            keys = [k.encode("utf-8") for k in value]
+            offset = self._node(_DICT, len(pairs))
+            for pair in pairs:
+                self.buf += _PAIR.pack(*pair)
+            for index in sorted(range(len(keys)), key=keys.__getitem__):
+                self.buf += _U32.pack(index)
+            return offset
+        raise TypeError(f"Unsupported content type: {type(value).__name__}")
+
+    def _write_str(self, value):
+        if value not in self.strings:
+            data = value.encode("utf-8")
+            self.strings[value] = self._node(_STR, len(data))
+            self.buf += data
+        return self.strings[value]
+
+    def _node(self, tag, count):
+        offset = len(self.buf)
+        self.buf += _NODE.pack(tag, count)
+        return offset
+
+
+def pack_content(content, fingerprint=()):
+    """
+    Encodes a nested dict/list/scalar structure into the store's binary format.
+    """
+    writer = _Writer()
+    root = writer.write(content)
+    sources = writer.write(list(fingerprint))
+    _HEADER.pack_into(writer.buf, 0, MAGIC, VERSION, root, sources)
+    return writer.buf
+
+
+def compile_content(out_path=STORE_PATH, base_dir="."):
+    """
+    Compiles the JSON sources into the binary store. The file is written to a
+    temporary path and renamed, so workers racing to rebuild never see a partial file.
+    """
+    fingerprint = source_mtimes(base_dir)  # taken first, so an edit mid-compile shows as stale
+    data = pack_content(collect_content(base_dir), fingerprint)
+    # One temp file per call: Streamlit sessions are threads, so a pid is not unique.
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(out_path) or ".", prefix=os.path.basename(out_path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates 0600; other workers must read it
+        os.replace(tmp_path, out_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return len(data)
+
+
+def _str_node(view, offset):
+    tag, count = _NODE.unpack_from(view, offset)
+    if tag != _STR:
+        return None
+    start = offset + _NODE.size
+    return view[start:start + count]
+
+
+def _read(view, offset):
+    tag, count = _NODE.unpack_from(view, offset)
+    start = offset + _NODE.size
+    if tag == _STR:
+        return str(view[start:start + count], "utf-8")
+    if tag == _LIST:
+        return MappedList(view, offset)
+    if tag == _DICT:
+        return MappedDict(view, offset)
+    if tag == _INT:
+        return int(str(view[start:start + count], "ascii"))
+    if tag == _FLOAT:
+        return _F64.unpack_from(view, start)[0]
+    if tag == _BOOL:
+        return bool(count)
+    if tag == _NULL:
+        return None
+    raise ValueError(f"Corrupt content store: unknown node tag {tag} at offset {offset}")
+
+
+class MappedList(Sequence):
+    """
+    Read-only list view over a LIST node; items are decoded only when accessed.
+    """
+    def __init__(self, view, offset):
+        self._view = view
+        self._start = offset + _NODE.size
+        self._len = _NODE.unpack_from(view, offset)[1]
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("MappedList index out of range")
+        return _read(self._view, _U32.unpack_from(self._view, self._start + index * _U32.size)[0])
+
+    def __contains__(self, value):
+        if not isinstance(value, str):
+            return Sequence.__contains__(self, value)
+        # Compare string items as raw bytes; nothing is decoded.
+        target = value.encode("utf-8")
+        for index in range(self._len):
+            offset = _U32.unpack_from(self._view, self._start + index * _U32.size)[0]
+            data = _str_node(self._view, offset)
+            if data is not None and data == target:
+                return True
+        return False
+
+    def __eq__(self, other):
+        if isinstance(other, (list, MappedList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"MappedList({list(self)!r})"
+
+
+class MappedDict(Mapping):
+    """
+    Read-only dict view over a DICT node. Lookups binary-search the sorted key
+    index; iteration follows the original insertion order.
+    """
+    def __init__(self, view, offset):
+        self._view = view
+        self._start = offset + _NODE.size
+        self._len = _NODE.unpack_from(view, offset)[1]
+        self._sorted = self._start + self._len * _PAIR.size
+
+    def __len__(self):
+        return self._len
+
+    def _pair(self, index):
+        return _PAIR.unpack_from(self._view, self._start + index * _PAIR.size)
+
+    def _key_bytes(self, key_offset):
+        return _str_node(self._view, key_offset)
+
+    def _find(self, key):
+        if not isinstance(key, str):
+            return None
+        target = key.encode("utf-8")
+        lo, hi = 0, self._len
+        while lo < hi:
+            mid = (lo + hi) // 2
+            index = _U32.unpack_from(self._view, self._sorted + mid * _U32.size)[0]
+            key_offset, value_offset = self._pair(index)
+            candidate = bytes(self._key_bytes(key_offset))  # keys are short, so the copy is cheap
+            if candidate == target:
+                return value_offset
+            if candidate < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def __getitem__(self, key):
+        value_offset = self._find(key)
+        if value_offset is None:
+            raise KeyError(key)
+        return _read(self._view, value_offset)
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __iter__(self):
+        for i in range(self._len):
+            yield _read(self._view, self._pair(i)[0])
+
+    def raw(self, key):
+        """
+        Returns a string value as a memoryview over the mapped file (no copy, no decode).
+        Release it (or let it go out of scope) once done so the store can be unmapped.
+        """
+        value_offset = self._find(key)
+        if value_offset is None:
+            raise KeyError(key)
+        data = _str_node(self._view, value_offset)
+        if data is None:
+            raise TypeError(f"Value for {key!r} is not a string")
+        return data
+
+    def __repr__(self):
+        return f"MappedDict({dict(self.items())!r})"
+
+
+class ContentStore(MappedDict):
+    """
+    The root of a compiled content store: the memory-mapped file at `path`, or an
+    in-memory `buffer` from pack_content() (private to the process, not shared).
+    """
+    def __init__(self, path=STORE_PATH, buffer=None):
+        self._mmap = None
+        if buffer is None:
+            with open(path, "rb") as file:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            buffer = self._mmap
+        view = memoryview(buffer)
+        try:
+            magic, version, root, sources = _HEADER.unpack_from(view, 0)
+        except struct.error:
+            magic, version, root, sources = None, None, None, None
+        if magic != MAGIC or version != VERSION:
+            view.release()
+            if self._mmap is not None:
+                self._mmap.close()
+            raise ValueError(f"{path} is not a version {VERSION} EduGenie content store")
+        self._closed = False
+        self.fingerprint = tuple(MappedList(view, sources))
+        super().__init__(view, root)
+
+    def close(self):
+        """
+        Closes the store. Views handed out earlier (MappedDict/MappedList) must not be
+        used afterwards. Memoryviews from raw() stay readable, and the file stays mapped
+        until the last of them is released.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # raw() views still alive; the mmap is unmapped when they are collected
+            self._mmap = None
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_store(path=STORE_PATH, base_dir="."):
+    """
+    Opens the content store, compiling it first if it is missing, unreadable, written
+    by another format version, or built from sources that have since been edited,
+    added or removed.
+    """
+    try:
+        store = ContentStore(path)
+    except (OSError, ValueError):
+        store = None
+    if store is not None and store.fingerprint == source_mtimes(base_dir):
+        return store
+    if store is not None:
+        store.close()
+    compile_content(path, base_dir)
+    return ContentStore(path)
+
+
+if __name__ == "__main__":
+    out_path = sys.argv[1] if len(sys.argv) > 1 else STORE_PATH
+    size = compile_content(out_path)
+    print(f"Wrote {size} bytes to {out_path}")
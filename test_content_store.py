@@ -0,0 +1,161 @@
+# test_content_store.py
+import json
+import os
+import shutil
+
+import pytest
+
+from content_store import (
+    QUIZ_SUBJECTS,
+    ContentStore,
+    MappedDict,
+    MappedList,
+    collect_content,
+    open_store,
+    pack_content,
+)
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCES = ["questions.json", "concepts.json"] + [f"quiz_{s}.json" for s in QUIZ_SUBJECTS]
+
+
+def unpack(value):
+    if isinstance(value, MappedDict):
+        return {k: unpack(v) for k, v in value.items()}
+    if isinstance(value, MappedList):
+        return [unpack(v) for v in value]
+    return value
+
+
+@pytest.fixture
+def content_dir(tmp_path):
+    for name in SOURCES:
+        shutil.copy(os.path.join(REPO_DIR, name), tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def store(content_dir):
+    with open_store(str(content_dir / "content.bin"), str(content_dir)) as store:
+        yield store
+
+
+def test_round_trip_matches_shipped_json(store, content_dir):
+    assert unpack(store) == collect_content(str(content_dir))
+
+
+def test_dict_iteration_keeps_insertion_order(store):
+    assert list(store["concept_hierarchy"]["Physics"]) == ["foundational", "intermediate", "advanced"]
+
+
+def test_key_lookup(store):
+    resources = store["concept_resources"]
+    assert resources["Kinematics"]["auditory"] == ["Kinematics Audio Lecture"]
+    assert "Kinematics" in resources
+    assert "Thermodynamics" not in resources
+    assert resources.get("Thermodynamics") is None
+    with pytest.raises(KeyError):
+        resources["Thermodynamics"]
+    assert 3 not in resources
+    assert resources.get(None) is None
+
+
+def test_lookup_over_many_unicode_keys():
+    keys = ["", "a", "ab", "b", "é", "中", "z", "zz", "Kinematics", "kinematics"]
+    data = {k: i for i, k in enumerate(keys)}
+    with ContentStore(buffer=pack_content(data)) as store:
+        assert [store[k] for k in keys] == list(range(len(keys)))
+        assert "ä" not in store and "zzz" not in store
+
+
+def test_list_access_and_contains(store):
+    foundational = store["concept_hierarchy"]["Physics"]["foundational"]
+    assert foundational[0] == "Kinematics"
+    assert foundational[-1] == "Work and Energy"
+    assert foundational[:2] == ["Kinematics", "Laws of Motion"]
+    assert "Laws of Motion" in foundational
+    assert "Optics" not in foundational
+    with pytest.raises(IndexError):
+        foundational[len(foundational)]
+
+
+def test_raw_returns_string_bytes(store):
+    question = store["quizzes"]["physics"][0]
+    raw = question.raw("answer")
+    assert isinstance(raw, memoryview)
+    assert raw == question["answer"].encode("utf-8")
+    raw.release()
+    with pytest.raises(TypeError):
+        question.raw("options")
+    with pytest.raises(KeyError):
+        question.raw("missing")
+
+
+def test_scalars_round_trip():
+    data = {"int": 2, "big": 10 ** 30, "neg": -7, "float": 0.5, "true": True, "false": False, "null": None}
+    with ContentStore(buffer=pack_content(data)) as store:
+        assert dict(store) == data
+        assert store["true"] is True and store["null"] is None
+
+
+def test_bad_header_is_rebuilt(content_dir):
+    path = content_dir / "content.bin"
+    path.write_bytes(b"not a content store")
+    with open_store(str(path), str(content_dir)) as store:
+        assert "questions" in store
+
+
+def test_source_edit_triggers_rebuild(content_dir):
+    path = str(content_dir / "content.bin")
+    open_store(path, str(content_dir)).close()
+    quiz_file = content_dir / "quiz_physics.json"
+    quiz = json.loads(quiz_file.read_text())
+    quiz["questions"][0]["difficulty"] = 2
+    quiz_file.write_text(json.dumps(quiz))
+    built = os.path.getmtime(path)
+    os.utime(quiz_file, (built + 10, built + 10))
+    with open_store(path, str(content_dir)) as store:
+        assert store["quizzes"]["physics"][0]["difficulty"] == 2
+
+
+def test_source_removal_triggers_rebuild(content_dir):
+    path = str(content_dir / "content.bin")
+    with open_store(path, str(content_dir)) as store:
+        assert "questions" in store
+    os.remove(content_dir / "questions.json")
+    with open_store(path, str(content_dir)) as store:
+        assert "questions" not in store
+
+
+def test_collect_content_records_malformed_files(content_dir):
+    (content_dir / "quiz_physics.json").write_text("{not json")
+    with pytest.raises(ValueError):
+        collect_content(str(content_dir))
+    errors = []
+    content = collect_content(str(content_dir), errors=errors)
+    assert "physics" not in content["quizzes"]
+    assert [os.path.basename(path) for path, _ in errors] == ["quiz_physics.json"]
+
+
+def test_collect_content_records_wrongly_shaped_files(content_dir):
+    (content_dir / "quiz_physics.json").write_text("[1, 2]")
+    (content_dir / "quiz_biology.json").write_text('{"questions": {"q": 1}}')
+    (content_dir / "concepts.json").write_text('{"concept_hierarchy": [], "concept_resources": {}}')
+    with pytest.raises(ValueError):
+        collect_content(str(content_dir))
+    errors = []
+    content = collect_content(str(content_dir), errors=errors)
+    assert sorted(content["quizzes"]) == ["chemistry", "mathematics"]
+    assert content["concept_hierarchy"] == {}
+    assert sorted(os.path.basename(path) for path, _ in errors) == ["concepts.json", "quiz_biology.json", "quiz_physics.json"]
+
+
+def test_close_with_live_raw_view(store):
+    raw = store["quizzes"]["physics"][0].raw("answer")
+    quizzes = store["quizzes"]
+    store.close()
+    store.close()
+    assert store.closed
+    assert bytes(raw) == b"Rate of change of displacement"
+    with pytest.raises(ValueError):
+        quizzes["physics"]